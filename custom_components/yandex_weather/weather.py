@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import partial
 import logging
 
 from homeassistant.components.weather import (
@@ -56,6 +57,19 @@ from .device_trigger import TRIGGERS
 from .updater import WeatherUpdater
 
 _LOGGER = logging.getLogger(__name__)
+_UTC = timezone.utc
+
+_TEMPERATURE_CONVERTER = UNIT_CONVERSIONS[ATTR_WEATHER_TEMPERATURE_UNIT]
+_PRESSURE_CONVERTER = UNIT_CONVERSIONS[ATTR_WEATHER_PRESSURE_UNIT]
+_WIND_SPEED_CONVERTER = UNIT_CONVERSIONS[ATTR_WEATHER_WIND_SPEED_UNIT]
+_PRECIPITATION_CONVERTER = UNIT_CONVERSIONS[ATTR_WEATHER_PRECIPITATION_UNIT]
+_RESTORE_EXTRAS = (
+    "feels_like",
+    "wind_gust",
+    "yandex_condition",
+    "temp_water",
+    "forecast_icons",
+)
 
 
 async def async_setup_entry(
@@ -74,6 +88,15 @@ async def async_setup_entry(
 class YandexWeather(WeatherEntity, CoordinatorEntity, RestoreEntity):
     """Yandex.Weather entry."""
 
+    __slots__ = (
+        "_forecast_cache",
+        "_forecast_cache_key",
+        "_forecast_cache_source",
+        "_image_fn",
+        "_image_source",
+        "_twice_daily_forecast",
+    )
+
     _attr_attribution = ATTRIBUTION
     _attr_native_wind_speed_unit = UnitOfSpeed.METERS_PER_SECOND
     _attr_native_pressure_unit = UnitOfPressure.HPA
@@ -101,6 +124,10 @@ class YandexWeather(WeatherEntity, CoordinatorEntity, RestoreEntity):
         self._attr_device_info = self.coordinator.device_info
         self._attr_supported_features = WeatherEntityFeature.FORECAST_TWICE_DAILY
         self._image_source = get_value(config_entry, CONF_IMAGE_SOURCE, "Yandex")
+        self._image_fn = partial(get_image, image_source=self._image_source)
+        self._forecast_cache_key = None
+        self._forecast_cache_source = None
+        self._forecast_cache = None
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -117,79 +144,86 @@ class YandexWeather(WeatherEntity, CoordinatorEntity, RestoreEntity):
             self._attr_available = False
             await self.coordinator.async_config_entry_first_refresh()
         else:
-            _LOGGER.debug(f"state for restore: {state}")
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("state for restore: %s", state)
+            attrs = state.attributes
             self._attr_available = True
             self._attr_condition = state.state
-            for attribute, converter in [
-                ("temperature", UNIT_CONVERSIONS[ATTR_WEATHER_TEMPERATURE_UNIT]),
-                ("pressure", UNIT_CONVERSIONS[ATTR_WEATHER_PRESSURE_UNIT]),
-                ("wind_speed", UNIT_CONVERSIONS[ATTR_WEATHER_WIND_SPEED_UNIT]),
-            ]:
-                try:
-                    setattr(
-                        self,
-                        f"_attr_native_{attribute}",
-                        converter(
-                            state.attributes.get(attribute),
-                            state.attributes.get(
-                                f"_{attribute}_unit",
-                                getattr(self, f"_attr_native_{attribute}_unit"),
-                            ),
-                            getattr(self, f"_attr_native_{attribute}_unit"),
-                        ),
-                    )
-                except TypeError:
-                    pass
+            if (value := attrs.get("temperature")) is not None:
+                self._attr_native_temperature = _TEMPERATURE_CONVERTER(
+                    value,
+                    attrs.get("_temperature_unit", self._attr_native_temperature_unit),
+                    self._attr_native_temperature_unit,
+                )
+            if (value := attrs.get("pressure")) is not None:
+                self._attr_native_pressure = _PRESSURE_CONVERTER(
+                    value,
+                    attrs.get("_pressure_unit", self._attr_native_pressure_unit),
+                    self._attr_native_pressure_unit,
+                )
+            if (value := attrs.get("wind_speed")) is not None:
+                self._attr_native_wind_speed = _WIND_SPEED_CONVERTER(
+                    value,
+                    attrs.get("_wind_speed_unit", self._attr_native_wind_speed_unit),
+                    self._attr_native_wind_speed_unit,
+                )
 
-            self._attr_humidity = state.attributes.get("humidity")
-            self._attr_wind_bearing = state.attributes.get("wind_bearing")
-            self._attr_entity_picture = state.attributes.get("entity_picture")
-            self._twice_daily_forecast = state.attributes.get(ATTR_FORECAST_DATA, [])
+            self._attr_humidity = attrs.get("humidity")
+            self._attr_wind_bearing = attrs.get("wind_bearing")
+            self._attr_entity_picture = attrs.get("entity_picture")
+            self._twice_daily_forecast = attrs.get(ATTR_FORECAST_DATA, [])
+            # (attribute, converter, stored unit, native unit)
+            forecast_converters = (
+                (
+                    "temperature",
+                    _TEMPERATURE_CONVERTER,
+                    self._temperature_unit,
+                    self._attr_native_temperature_unit,
+                ),
+                (
+                    "pressure",
+                    _PRESSURE_CONVERTER,
+                    self._pressure_unit,
+                    self._attr_native_pressure_unit,
+                ),
+                (
+                    "wind_speed",
+                    _WIND_SPEED_CONVERTER,
+                    self._wind_speed_unit,
+                    self._attr_native_wind_speed_unit,
+                ),
+                (
+                    "precipitation",
+                    _PRECIPITATION_CONVERTER,
+                    self._precipitation_unit,
+                    self._attr_native_precipitation_unit,
+                ),
+            )
             for f in self._twice_daily_forecast:
-                for attribute, converter in [
-                    ("temperature", UNIT_CONVERSIONS[ATTR_WEATHER_TEMPERATURE_UNIT]),
-                    ("pressure", UNIT_CONVERSIONS[ATTR_WEATHER_PRESSURE_UNIT]),
-                    ("wind_speed", UNIT_CONVERSIONS[ATTR_WEATHER_WIND_SPEED_UNIT]),
-                    (
-                        "precipitation",
-                        UNIT_CONVERSIONS[ATTR_WEATHER_PRECIPITATION_UNIT],
-                    ),
-                ]:
-                    try:
-                        f[attribute] = converter(
-                            f.get(attribute),
-                            getattr(
-                                self,
-                                f"_{attribute}_unit",
-                                getattr(self, f"_attr_native_{attribute}_unit"),
-                            ),
-                            getattr(self, f"_attr_native_{attribute}_unit"),
-                        )
-                    except TypeError:
-                        pass
+                for attribute, converter, unit, native_unit in forecast_converters:
+                    if (value := f.get(attribute)) is not None:
+                        f[attribute] = converter(value, unit, native_unit)
 
             self._attr_extra_state_attributes = {
-                ATTR_FORECAST_DATA: self._twice_daily_forecast,
+                attribute: value
+                for attribute in _RESTORE_EXTRAS
+                if (value := attrs.get(attribute)) is not None
             }
-            for attribute in [
-                "feels_like",
-                "wind_gust",
-                "yandex_condition",
-                "temp_water",
-                "forecast_icons",
-            ]:
-                value = state.attributes.get(attribute)
-                if value is not None:
-                    self._attr_extra_state_attributes[attribute] = value
+            self._attr_extra_state_attributes[
+                ATTR_FORECAST_DATA
+            ] = self._twice_daily_forecast
 
             # last_updated is last call of self.async_write_ha_state(), not a real last update
-            since_last_update = datetime.now(timezone.utc) - state.last_updated.replace(
-                tzinfo=timezone.utc
-            )
-            _LOGGER.debug(
-                f"Time since last update: {since_last_update} ({state.last_updated}), "
-                f"update interval is {self.coordinator.update_interval}"
+            since_last_update = datetime.now(_UTC) - state.last_updated.replace(
+                tzinfo=_UTC
             )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Time since last update: %s (%s), update interval is %s",
+                    since_last_update,
+                    state.last_updated,
+                    self.coordinator.update_interval,
+                )
             if since_last_update > self.coordinator.update_interval:
                 await self.coordinator.async_config_entry_first_refresh()
             else:
@@ -199,35 +233,30 @@ class YandexWeather(WeatherEntity, CoordinatorEntity, RestoreEntity):
         self.async_write_ha_state()
 
     def _handle_coordinator_update(self) -> None:
+        data = self.coordinator.data
         self._attr_available = True
-        self.update_condition_and_fire_event(
-            new_condition=self.coordinator.data.get(ATTR_API_CONDITION)
-        )
-        self._attr_entity_picture = get_image(
-            image_source=self._image_source,
-            condition=self.coordinator.data.get(ATTR_API_ORIGINAL_CONDITION),
-            is_day=self.coordinator.data.get("daytime") == "d",
-            image=self.coordinator.data.get(ATTR_API_IMAGE),
+        self._forecast_cache_key = None
+        self.update_condition_and_fire_event(new_condition=data.get(ATTR_API_CONDITION))
+        self._attr_entity_picture = self._image_fn(
+            condition=data.get(ATTR_API_ORIGINAL_CONDITION),
+            is_day=data.get("daytime") == "d",
+            image=data.get(ATTR_API_IMAGE),
         )
-        self._twice_daily_forecast = self.coordinator.data.get(ATTR_FORECAST_DATA, [])
-        self._attr_humidity = self.coordinator.data.get(ATTR_API_HUMIDITY)
-        self._attr_native_pressure = self.coordinator.data.get(ATTR_API_PRESSURE)
-        self._attr_native_temperature = self.coordinator.data.get(ATTR_API_TEMPERATURE)
-        self._attr_native_wind_speed = self.coordinator.data.get(ATTR_API_WIND_SPEED)
-        self._attr_wind_bearing = self.coordinator.data.get(ATTR_API_WIND_BEARING)
+        self._twice_daily_forecast = data.get(ATTR_FORECAST_DATA, [])
+        self._attr_humidity = data.get(ATTR_API_HUMIDITY)
+        self._attr_native_pressure = data.get(ATTR_API_PRESSURE)
+        self._attr_native_temperature = data.get(ATTR_API_TEMPERATURE)
+        self._attr_native_wind_speed = data.get(ATTR_API_WIND_SPEED)
+        self._attr_wind_bearing = data.get(ATTR_API_WIND_BEARING)
         self._attr_extra_state_attributes = {
-            "feels_like": self.coordinator.data.get(ATTR_API_FEELS_LIKE_TEMPERATURE),
-            "wind_gust": self.coordinator.data.get(ATTR_API_WIND_GUST),
-            "yandex_condition": self.coordinator.data.get(ATTR_API_YA_CONDITION),
-            "forecast_icons": self.coordinator.data.get(ATTR_API_FORECAST_ICONS),
+            "feels_like": data.get(ATTR_API_FEELS_LIKE_TEMPERATURE),
+            "wind_gust": data.get(ATTR_API_WIND_GUST),
+            "yandex_condition": data.get(ATTR_API_YA_CONDITION),
+            "forecast_icons": data.get(ATTR_API_FORECAST_ICONS),
             ATTR_FORECAST_DATA: self.__forecast_twice_daily(),
         }
-        try:
-            self._attr_extra_state_attributes["temp_water"] = self.coordinator.data.get(
-                ATTR_API_TEMP_WATER
-            )
-        except KeyError:
-            self.coordinator.logger.debug("data have no temp_water. Skipping.")
+        if (temp_water := data.get(ATTR_API_TEMP_WATER)) is not None:
+            self._attr_extra_state_attributes["temp_water"] = temp_water
 
         self.async_write_ha_state()
 
@@ -248,31 +277,56 @@ class YandexWeather(WeatherEntity, CoordinatorEntity, RestoreEntity):
 
         self._attr_condition = new_condition
 
-    def __forecast_twice_daily(self) -> list[Forecast] | None:
+    def __forecast_twice_daily(self) -> list[Forecast]:
         """Return the daily forecast in native units."""
-        _LOGGER.debug(f"async_forecast_twice_daily: {self._twice_daily_forecast=}")
-        # we must return at least three elements in forecast
-        # https://github.com/home-assistant/frontend/blob/dev/src/data/weather.ts#L548
-        if len(result := self._twice_daily_forecast) < 3:
+        key = (
+            self._attr_condition,
+            self._attr_native_temperature,
+            self._attr_wind_bearing,
+            self._attr_native_pressure,
+            self._attr_native_wind_speed,
+        )
+        if (
+            key == self._forecast_cache_key
+            and self._twice_daily_forecast is self._forecast_cache_source
+        ):
+            return self._forecast_cache
+
+        self._forecast_cache = self.__build_forecast_twice_daily()
+        self._forecast_cache_key = key
+        self._forecast_cache_source = self._twice_daily_forecast
+        return self._forecast_cache
+
+    def __build_forecast_twice_daily(self) -> list[Forecast]:
+        """Build the daily forecast, prepending current weather if it is too short."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
-                "Have not enough forecast data. Adding current weather to forecast..."
-            )
-            result.insert(
-                0,
-                Forecast(
-                    datetime=self.coordinator.data.get(ATTR_API_WEATHER_TIME),
-                    wind_bearing=self.wind_bearing,
-                    native_temperature=self.native_temperature,
-                    temperature=self.native_temperature,
-                    native_templow=self.native_temperature,
-                    templow=self.native_temperature,
-                    native_pressure=self.native_pressure,
-                    native_wind_speed=self.native_wind_speed,
-                    condition=self.condition,
-                    is_daytime=self.coordinator.data.get("daytime") == "d",
-                ),
+                "async_forecast_twice_daily: self._twice_daily_forecast=%s",
+                self._twice_daily_forecast,
             )
-        return result
+        # we must return at least three elements in forecast
+        # https://github.com/home-assistant/frontend/blob/dev/src/data/weather.ts#L548
+        if len(forecast := self._twice_daily_forecast or []) >= 3:
+            return forecast
+
+        _LOGGER.debug(
+            "Have not enough forecast data. Adding current weather to forecast..."
+        )
+        return [
+            Forecast(
+                datetime=self.coordinator.data.get(ATTR_API_WEATHER_TIME),
+                wind_bearing=self.wind_bearing,
+                native_temperature=self.native_temperature,
+                temperature=self.native_temperature,
+                native_templow=self.native_temperature,
+                templow=self.native_temperature,
+                native_pressure=self.native_pressure,
+                native_wind_speed=self.native_wind_speed,
+                condition=self.condition,
+                is_daytime=self.coordinator.data.get("daytime") == "d",
+            ),
+            *forecast,
+        ]
 
     async def async_forecast_twice_daily(self) -> list[Forecast] | None:
         return self.__forecast_twice_daily()
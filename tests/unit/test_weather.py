@@ -0,0 +1,75 @@
+"""Tests for weather entity."""
+from unittest.mock import AsyncMock
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.helpers.update_coordinator import UpdateFailed
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.yandex_weather.const import (
+    ATTR_API_WEATHER_TIME,
+    ATTR_FORECAST_DATA,
+    DOMAIN,
+)
+from custom_components.yandex_weather.updater import WeatherUpdater
+from custom_components.yandex_weather.weather import YandexWeather
+
+
+def create_entity(hass) -> YandexWeather:
+    """Create weather entity which is not added to any platform."""
+    updater = WeatherUpdater(0, 0, "", hass, "test_device")
+    entity = YandexWeather(
+        "test", MockConfigEntry(domain=DOMAIN, unique_id="test"), updater, hass
+    )
+    entity.entity_id = "weather.test"
+    return entity
+
+
+@pytest.mark.parametrize("_bypass_get_data", ["test_data.json"], indirect=True)
+@pytest.mark.asyncio
+async def test_unavailable_after_failed_refresh(hass, _bypass_get_data):
+    """Test entity state becomes unavailable if refresh failed."""
+    entity = create_entity(hass)
+    entity.coordinator.async_add_listener(entity._handle_coordinator_update)
+
+    await entity.coordinator.async_refresh()
+    assert hass.states.get(entity.entity_id).state != STATE_UNAVAILABLE
+
+    entity.coordinator.update_method = AsyncMock(side_effect=UpdateFailed("test"))
+    await entity.coordinator.async_refresh()
+    assert hass.states.get(entity.entity_id).state == STATE_UNAVAILABLE
+
+
+def test_short_forecast_is_not_mutated(hass):
+    """Test current weather is prepended to a copy of short forecast."""
+    entity = create_entity(hass)
+    forecast = [{"native_temperature": 1}, {"native_temperature": 2}]
+    entity.coordinator.data = {
+        ATTR_API_WEATHER_TIME: "2023-12-01T12:00:00+03:00",
+        ATTR_FORECAST_DATA: forecast,
+    }
+    entity._twice_daily_forecast = forecast
+
+    entity._YandexWeather__build_forecast_twice_daily()
+    result = entity._YandexWeather__build_forecast_twice_daily()
+
+    assert len(entity._twice_daily_forecast) == 2
+    assert len(entity.coordinator.data[ATTR_FORECAST_DATA]) == 2
+    assert len(result) == 3
+    assert result[0]["datetime"] == "2023-12-01T12:00:00+03:00"
+    assert result[1:] == forecast
+
+
+@pytest.mark.parametrize("_bypass_get_data", ["test_data.json"], indirect=True)
+@pytest.mark.asyncio
+async def test_forecast_cache(hass, _bypass_get_data):
+    """Test forecast is cached until next coordinator update."""
+    entity = create_entity(hass)
+    entity.coordinator.async_add_listener(entity._handle_coordinator_update)
+    await entity.coordinator.async_refresh()
+
+    forecast = await entity.async_forecast_twice_daily()
+    assert await entity.async_forecast_twice_daily() is forecast
+
+    await entity.coordinator.async_refresh()
+    assert await entity.async_forecast_twice_daily() is not forecast